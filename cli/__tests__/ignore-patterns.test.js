@@ -21,7 +21,7 @@ import fs from 'fs';
 import path from 'path';
 import os from 'os';
 
-import { loadShipSafeIgnorePatterns, findUpwards, isTestFile, isExampleFile } from '../utils/patterns.js';
+import { loadShipSafeIgnorePatterns, loadGitignorePatterns, findUpwards, isTestFile, isExampleFile } from '../utils/patterns.js';
 import { createFinding, projectFindings, environmentFindings } from '../agents/base-agent.js';
 import { ScoringEngine } from '../agents/scoring-engine.js';
 
@@ -86,6 +86,33 @@ describe('loadShipSafeIgnorePatterns', () => {
   });
 });
 
+describe('loadGitignorePatterns', () => {
+  function gitignore(body) {
+    const ws = workspace(null);
+    fs.writeFileSync(path.join(ws.dir, '.gitignore'), body);
+    return ws;
+  }
+
+  it('ignores everything under a directory-matching entry', () => {
+    // Only patterns ending in /** stop fast-glob descending into a directory.
+    const ws = gitignore('/build\n*.egg-info\nlogs/\n');
+    try {
+      assert.deepEqual(loadGitignorePatterns(ws.dir), [
+        'build', 'build/**',
+        '**/*.egg-info', '**/*.egg-info/**',
+        '**/logs/**',
+      ]);
+    } finally { ws.cleanup(); }
+  });
+
+  it('keeps scanning security-sensitive and negated entries', () => {
+    const ws = gitignore('.env\n*.pem\n!keep.js\ndist\n');
+    try {
+      assert.deepEqual(loadGitignorePatterns(ws.dir), ['**/dist', '**/dist/**']);
+    } finally { ws.cleanup(); }
+  });
+});
+
 describe('findUpwards', () => {
   it('returns null when nothing matches', () => {
     const ws = workspace(null);
@@ -0,0 +1,146 @@
+/**
+ * Pattern matcher — the scan command's per-file matching engine.
+ *
+ * The combined regex only decides which lines are worth checking; findings
+ * must be exactly what running every pattern on every line would report.
+ *
+ * Run: npm test
+ */
+
+import { describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+
+import { SECRET_PATTERNS, SECURITY_PATTERNS } from '../utils/patterns.js';
+import { compilePatterns, scanContent, matchContent, toFindings, requiredLiterals } from '../utils/pattern-matcher.js';
+
+const ALL_PATTERNS = [...SECRET_PATTERNS, ...SECURITY_PATTERNS];
+const AWS_KEY = 'AKIA' + 'Q7ZK3M9XW2PL5RT8';
+const OPENAI_KEY = 'sk-' + 'Zx9Kq2Lm7Vb4Np8Rt3Wy6Hc1';
+
+describe('compilePatterns', () => {
+  it('splits patterns into case-sensitive and case-insensitive gates', () => {
+    const matcher = compilePatterns(ALL_PATTERNS);
+    assert.equal(matcher.prefilters.length, 2);
+    assert.equal(matcher.gates.length, 2);
+    assert.equal(matcher.ungated.length, 0);
+  });
+
+  it('keeps patterns with backreferences out of the gates', () => {
+    const custom = { name: 'Repeated', pattern: /(abc)\1/g, severity: 'high' };
+    const matcher = compilePatterns([...ALL_PATTERNS, custom]);
+    assert.deepEqual(matcher.ungated, [custom]);
+  });
+});
+
+describe('requiredLiterals', () => {
+  it('reads a leading run of plain characters', () => {
+    assert.deepEqual(requiredLiterals('sk_live_[a-zA-Z0-9]{24,}'), ['sk_live_']);
+    assert.deepEqual(requiredLiterals('dp\\.st\\.[a-z]+'), ['dp.st.']);
+  });
+
+  it('reads a group of plain alternatives', () => {
+    assert.deepEqual(requiredLiterals('(?:cohere|COHERE)[_-]?key'), ['cohere', 'COHERE']);
+  });
+
+  it('takes one literal from each top-level alternative', () => {
+    assert.deepEqual(requiredLiterals('ghu_[a-z]{36}|ghs_[a-z]{36}'), ['ghu_', 'ghs_']);
+  });
+
+  it('drops characters made optional by a quantifier', () => {
+    assert.deepEqual(requiredLiterals('postgres(ql)?:\\/\\/x'), ['postgres']);
+    assert.deepEqual(requiredLiterals('abcd?e'), ['abc']);
+  });
+
+  it('reads multi-character escapes as one non-literal atom', () => {
+    assert.deepEqual(requiredLiterals('x\\x41yz'), ['yz']);
+    assert.deepEqual(requiredLiterals('ab\\cJdefg'), ['defg']);
+    assert.deepEqual(requiredLiterals('\\u{41}bcd'), ['bcd']);
+    assert.deepEqual(requiredLiterals('ab\\u0041cdef'), ['cdef']);
+    assert.deepEqual(requiredLiterals('(a)\\12xyz'), ['xyz']);
+  });
+
+  it('returns null when an alternative has no literal', () => {
+    assert.equal(requiredLiterals('[a-f0-9]{32}|AKIA'), null);
+  });
+});
+
+describe('scanContent', () => {
+  const matcher = compilePatterns(ALL_PATTERNS);
+
+  it('reports the line and column of a match', () => {
+    const content = ['const a = 1;', '', `const key = "${AWS_KEY}";`].join('\n');
+    const findings = scanContent(content, matcher);
+    assert.equal(findings.length, 1);
+    assert.equal(findings[0].patternName, 'AWS Access Key ID');
+    assert.equal(findings[0].line, 3);
+    assert.equal(findings[0].column, 14);
+  });
+
+  it('reports overlapping matches from different patterns', () => {
+    const findings = scanContent(`api_key = "${OPENAI_KEY}"`, matcher);
+    const names = findings.map(f => f.patternName);
+    assert.ok(names.includes('OpenAI API Key'));
+    assert.ok(names.includes('Generic API Key Assignment'));
+  });
+
+  it('honours ship-safe-ignore on the matching line', () => {
+    const findings = scanContent(`const key = "${AWS_KEY}"; // ship-safe-ignore`, matcher);
+    assert.deepEqual(findings, []);
+  });
+
+  it('confirms a literal hit before checking the line', () => {
+    const content = ['const store_id = 1;', `const key = "${AWS_KEY}";`].join('\n');
+    const findings = scanContent(content, matcher);
+    assert.deepEqual(findings.map(f => f.line), [2]);
+  });
+
+  it('finds a literal that overlaps a longer one', () => {
+    const findings = scanContent(`x = "AAAAAAAAAAAAAAAAAAAAA${AWS_KEY.slice(1)}"`, matcher);
+    assert.ok(findings.some(f => f.patternName === 'AWS Access Key ID'));
+  });
+
+  it('finds literals at the edges of the content and in any case', () => {
+    assert.deepEqual(scanContent(AWS_KEY, matcher).map(f => f.column), [1]);
+    const custom = { name: 'Shouty', pattern: /loudkey_[0-9]{4}/gi, severity: 'high', description: '' };
+    const findings = scanContent('x = LOUDKEY_1234', compilePatterns([custom]));
+    assert.deepEqual(findings.map(f => f.matched), ['LOUDKEY_1234']);
+  });
+
+  it('matches patterns whose literals sit next to hex escapes', () => {
+    const custom = { name: 'Hex', pattern: /x\x41yz|ab\x43defg/g, severity: 'high', description: '' };
+    const findings = scanContent('xAyz abCdefg', compilePatterns([custom]));
+    assert.deepEqual(findings.map(f => f.matched), ['xAyz', 'abCdefg']);
+  });
+
+  it('searches case-insensitive non-ASCII literals by regex', () => {
+    const custom = { name: 'Accented', pattern: /ābcd[0-9]+/gi, severity: 'high', description: '' };
+    const accented = compilePatterns([custom]);
+    assert.equal(accented.prefilters[0].prefixes, null);
+    assert.equal(scanContent('ĀBCD42', accented).length, 1);
+  });
+
+  it('does not match across lines', () => {
+    const content = ['const url = "postgres://admin', `password@db.example.com ${AWS_KEY}"`].join('\n');
+    const findings = scanContent(content, matcher);
+    assert.deepEqual(findings.map(f => [f.line, f.patternName]), [[2, 'AWS Access Key ID']]);
+  });
+
+  it('still checks ungated patterns on every line', () => {
+    const custom = { name: 'Repeated', pattern: /(abc)\1/g, severity: 'high', description: '' };
+    const findings = scanContent('x\nabcabc', compilePatterns([custom]));
+    assert.equal(findings.length, 1);
+    assert.equal(findings[0].line, 2);
+  });
+});
+
+describe('matchContent', () => {
+  const matcher = compilePatterns(ALL_PATTERNS);
+
+  it('returns compact matches that toFindings expands into findings', () => {
+    const content = `const key = "${AWS_KEY}";`;
+    const matches = matchContent(content, matcher);
+    const index = ALL_PATTERNS.findIndex(p => p.name === 'AWS Access Key ID');
+    assert.deepEqual(matches, [[1, 14, AWS_KEY, index, 'high']]);
+    assert.deepEqual(toFindings(matches, matcher.patterns), scanContent(content, matcher));
+  });
+});
@@ -0,0 +1,109 @@
+/**
+ * Scan pool — parallel file scanning for the scan command.
+ *
+ * Worker threads must return the same findings, in the same file order, as
+ * scanning on the main thread.
+ *
+ * Run: npm test
+ */
+
+import { describe, it, before, after } from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+
+import { SECRET_PATTERNS, SECURITY_PATTERNS } from '../utils/patterns.js';
+import { compilePatterns } from '../utils/pattern-matcher.js';
+import { scanFiles, scanFile } from '../utils/scan-pool.js';
+
+const ALL_PATTERNS = [...SECRET_PATTERNS, ...SECURITY_PATTERNS];
+const AWS_KEY = 'AKIA' + 'Q7ZK3M9XW2PL5RT8';
+
+describe('scanFiles', () => {
+  let dir;
+  const files = [];
+
+  before(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'ship-safe-pool-'));
+    for (let i = 0; i < 1200; i++) {
+      const file = path.join(dir, `f${i}.js`);
+      const body = i % 97 === 0 ? `const key = "${AWS_KEY}";\n` : 'const a = 1;\n';
+      fs.writeFileSync(file, body.repeat(3));
+      files.push(file);
+    }
+  });
+
+  after(() => fs.rmSync(dir, { recursive: true, force: true }));
+
+  it('matches scanning each file on the main thread', async () => {
+    const matcher = compilePatterns(ALL_PATTERNS);
+    const expected = files
+      .map(file => ({ file, findings: scanFile(file, matcher) }))
+      .filter(r => r.findings.length > 0);
+
+    const { results, scannedCount, stopped } = await scanFiles(files, ALL_PATTERNS, { workers: 3 });
+    assert.equal(results.length, 13);
+    assert.deepEqual(results, expected);
+    assert.equal(scannedCount, files.length);
+    assert.equal(stopped, false);
+  });
+
+  it('carries custom patterns into workers', async () => {
+    const custom = { name: '[custom] Internal', pattern: /const a/g, severity: 'high', description: '' };
+    let progress = 0;
+    const { results } = await scanFiles(files, [custom], { workers: 2, onProgress: (n) => { progress = n; } });
+    assert.equal(results.length, files.length - 13);
+    assert.equal(progress, files.length);
+  });
+
+  it('stops at the first file with findings when failing fast', async () => {
+    // Without ripgrep, so the files it would rule out are not counted as scanned
+    const sequential = await scanFiles(files, ALL_PATTERNS, { workers: 1, failFast: true, engine: 'node' });
+    assert.deepEqual(sequential.results.map(r => r.file), [files[0]]);
+    assert.equal(sequential.scannedCount, 1);
+    assert.equal(sequential.stopped, true);
+
+    const parallel = await scanFiles(files, ALL_PATTERNS, { workers: 2, failFast: true, engine: 'node' });
+    assert.ok(parallel.results.length >= 1 && parallel.results.length < 13);
+    assert.ok(parallel.scannedCount < files.length);
+    assert.equal(parallel.stopped, true);
+  });
+
+  it('does not report a stop when the only finding is in the last file', async () => {
+    const clean = files.filter((_, i) => i % 97 !== 0).slice(0, 20);
+    const { results, scannedCount, stopped } = await scanFiles([...clean, files[0]], ALL_PATTERNS, { workers: 1, failFast: true });
+    assert.equal(results.length, 1);
+    assert.equal(scannedCount, clean.length + 1);
+    assert.equal(stopped, false);
+  });
+});
+
+describe('scanFile', () => {
+  const matcher = compilePatterns(ALL_PATTERNS);
+  let dir;
+
+  before(() => { dir = fs.mkdtempSync(path.join(os.tmpdir(), 'ship-safe-sniff-')); });
+  after(() => fs.rmSync(dir, { recursive: true, force: true }));
+
+  it('skips files that look binary', () => {
+    const file = path.join(dir, 'artifact');
+    fs.writeFileSync(file, Buffer.concat([Buffer.from([0x7f, 0x45, 0x4c, 0x46, 0x00]), Buffer.from(AWS_KEY)]));
+    assert.deepEqual(scanFile(file, matcher), []);
+  });
+
+  it('reads files of any size, one after another', () => {
+    const large = path.join(dir, 'large.js');
+    const small = path.join(dir, 'small.js');
+    fs.writeFileSync(large, 'const a = 1;\n'.repeat(90_000) + `const key = "${AWS_KEY}";\n`);
+    fs.writeFileSync(small, `const key = "${AWS_KEY}";\n`);
+    assert.deepEqual(scanFile(large, matcher).map(f => f.line), [90_001]);
+    assert.deepEqual(scanFile(small, matcher).map(f => f.line), [1]);
+  });
+
+  it('still scans text with a few control characters', () => {
+    const file = path.join(dir, 'notes');
+    fs.writeFileSync(file, `\x1b[1mkey\x1b[0m = "${AWS_KEY}"\n`);
+    assert.equal(scanFile(file, matcher).length, 1);
+  });
+});
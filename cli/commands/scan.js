@@ -9,6 +9,8 @@
  *   ship-safe scan . -v              Verbose mode (show files being scanned)
  *   ship-safe scan . --json          Output as JSON (for CI integration)
  *   ship-safe scan . --include-tests Also scan test files (excluded by default)
+ *   ship-safe scan . --engine node   Don't use ripgrep to pick files, even if installed
+ *   ship-safe scan . --fail-fast     Stop at the first file with findings (pre-commit, CI)
  *
  * SUPPRESSING FALSE POSITIVES:
  *   Add  # ship-safe-ignore  as a comment on the same line to suppress a finding.
@@ -30,11 +32,11 @@ import {
   SKIP_DIRS,
   SKIP_EXTENSIONS,
   SKIP_FILENAMES,
-  TEST_FILE_PATTERNS,
   MAX_FILE_SIZE,
+  isTestFile,
   loadGitignorePatterns
 } from '../utils/patterns.js';
-import { isHighEntropyMatch, getConfidence } from '../utils/entropy.js';
+import { scanFiles } from '../utils/scan-pool.js';
 import * as output from '../utils/output.js';
 import { CacheManager } from '../utils/cache-manager.js';
 
@@ -112,7 +114,7 @@ export async function scanCommand(targetPath = '.', options = {}) {
 
   try {
     // Find all files
-    const files = await findFiles(absolutePath, ignorePatterns, options);
+    const { files, stats } = await findFiles(absolutePath, ignorePatterns, options);
 
     // Cache: determine which files changed
     const useCache = options.cache !== false;
@@ -123,7 +125,7 @@ export async function scanCommand(targetPath = '.', options = {}) {
     const cachedResults = [];
 
     if (cacheData) {
-      cacheDiff = cache.diff(files);
+      cacheDiff = cache.diff(files, stats);
       filesToScan = cacheDiff.changedFiles;
 
       // Group cached findings by file
@@ -151,27 +153,30 @@ export async function scanCommand(targetPath = '.', options = {}) {
       : '';
     spinner.text = `Scanning ${filesToScan.length} files${cacheNote}...`;
 
-    // Scan each file
-    const results = [];
-    let scannedCount = 0;
+    // With --fail-fast, a cached finding already decides the outcome
+    const stopEarly = options.failFast && cachedResults.length > 0;
 
-    for (const file of filesToScan) {
-      const findings = await scanFile(file, allPatterns);
-      if (findings.length > 0) {
-        results.push({ file, findings });
-      }
-
-      scannedCount++;
-      if (options.verbose) {
-        spinner.text = `Scanned ${scannedCount}/${filesToScan.length}: ${path.relative(absolutePath, file)}`;
-      }
-    }
+    // Scan changed files (in worker threads on large trees)
+    const scan = await scanFiles(stopEarly ? [] : filesToScan, allPatterns, {
+      engine: options.engine,
+      failFast: options.failFast,
+      onProgress: options.verbose
+        ? (scannedCount, file) => {
+          spinner.text = `Scanned ${scannedCount}/${filesToScan.length}: ${path.relative(absolutePath, file)}`;
+        }
+        : undefined,
+    });
 
     // Merge with cached results
-    const allResults = [...results, ...cachedResults];
+    const allResults = [...scan.results, ...cachedResults];
+
+    // A scan cut short by --fail-fast hasn't seen every file, so it can't be cached
+    const stoppedEarly = scan.stopped || (stopEarly && filesToScan.length > 0);
+    // Files whose cached findings were reused count as scanned
+    const filesScanned = files.length - filesToScan.length + scan.scannedCount;
 
     // Save cache
-    if (useCache) {
+    if (useCache && !stoppedEarly) {
       try {
         const allFindings = [];
         for (const { file, findings } of allResults) {
@@ -198,13 +203,17 @@ export async function scanCommand(targetPath = '.', options = {}) {
 
     spinner.stop();
 
+    if (stoppedEarly && !options.json && !options.sarif) {
+      output.warning('Stopped at the first file with findings (--fail-fast). Other files were not scanned.');
+    }
+
     // Output results
     if (options.sarif) {
       outputSARIF(allResults, absolutePath);
     } else if (options.json) {
-      outputJSON(allResults, files.length);
+      outputJSON(allResults, filesScanned);
     } else {
-      outputPretty(allResults, files.length, absolutePath);
+      outputPretty(allResults, filesScanned, absolutePath);
     }
 
     // Exit with appropriate code
@@ -242,32 +251,50 @@ function loadIgnoreFile(rootPath) {
 }
 
 /**
- * Check if a file path matches any ignore pattern.
+ * Compile ignore patterns into path tests, once per scan rather than per file.
  * Supports: exact paths, glob patterns, and directory prefixes.
  */
-function isIgnoredByFile(filePath, rootPath, ignorePatterns) {
-  if (ignorePatterns.length === 0) return false;
-
-  const relPath = path.relative(rootPath, filePath).replace(/\\/g, '/');
-
-  return ignorePatterns.some(pattern => {
+function compileIgnorePatterns(ignorePatterns) {
+  return ignorePatterns.map(pattern => {
     // Directory prefix match: "tests/" ignores everything under tests/
     if (pattern.endsWith('/')) {
-      return relPath.startsWith(pattern) || relPath.includes('/' + pattern);
+      return relPath => relPath.startsWith(pattern) || relPath.includes('/' + pattern);
     }
     // Simple glob: "**/fixtures/**" or "src/secrets.js"
     const escaped = pattern
       .replace(/[.+^${}()|[\]\\]/g, '\\$&')
       .replace(/\*/g, '[^/]*')
       .replace(/\?/g, '[^/]');
-    return new RegExp(`(^|/)${escaped}($|/)`).test(relPath);
+    const regex = new RegExp(`(^|/)${escaped}($|/)`);
+    return relPath => regex.test(relPath);
   });
 }
 
+/**
+ * Check if a file path matches any compiled ignore pattern.
+ */
+function isIgnoredByFile(filePath, rootPath, ignoreTests) {
+  if (ignoreTests.length === 0) return false;
+
+  const relPath = path.relative(rootPath, filePath).replace(/\\/g, '/');
+
+  return ignoreTests.some(test => test(relPath));
+}
+
 // =============================================================================
 // FILE DISCOVERY
 // =============================================================================
 
+/**
+ * Find the files to scan, with the fs.Stats of each so the cache check
+ * doesn't stat them again.
+ *
+ * Only files that pass the name filters are stat'ed. Asking fast-glob for
+ * stats would lstat every walked entry, skipped assets and tests included,
+ * and give up its readdir-with-file-types walk.
+ *
+ * @returns {Promise<{ files: string[], stats: Map<string, fs.Stats> }>}
+ */
 async function findFiles(rootPath, ignorePatterns, options = {}) {
   // Build ignore patterns from SKIP_DIRS
   const globIgnore = Array.from(SKIP_DIRS).map(dir => `**/${dir}/**`);
@@ -285,100 +312,39 @@ async function findFiles(rootPath, ignorePatterns, options = {}) {
     dot: true
   });
 
+  const ignoreTests = compileIgnorePatterns(ignorePatterns);
   const filtered = [];
+  const stats = new Map();
 
   for (const file of files) {
-    // Skip by extension
-    const ext = path.extname(file).toLowerCase();
-    if (SKIP_EXTENSIONS.has(ext)) continue;
-    if (SKIP_FILENAMES.has(path.basename(file))) continue;
+    // Skip by extension and name
+    const basename = path.basename(file);
+    if (SKIP_EXTENSIONS.has(path.extname(basename).toLowerCase())) continue;
+    if (SKIP_FILENAMES.has(basename)) continue;
 
     // Handle compound extensions like .min.js
-    const basename = path.basename(file);
     if (basename.endsWith('.min.js') || basename.endsWith('.min.css')) continue;
 
     // Skip test files by default (--include-tests to override)
     if (!options.includeTests && isTestFile(file)) continue;
 
     // Skip files matching .ship-safeignore
-    if (isIgnoredByFile(file, rootPath, ignorePatterns)) continue;
+    if (isIgnoredByFile(file, rootPath, ignoreTests)) continue;
 
     // Skip by size
+    let fileStats;
     try {
-      const stats = fs.statSync(file);
-      if (stats.size > MAX_FILE_SIZE) continue;
+      fileStats = fs.statSync(file);
     } catch {
       continue;
     }
+    if (fileStats.size > MAX_FILE_SIZE) continue;
 
     filtered.push(file);
+    stats.set(file, fileStats);
   }
 
-  return filtered;
-}
-
-function isTestFile(filePath) {
-  return TEST_FILE_PATTERNS.some(pattern => pattern.test(filePath));
-}
-
-// =============================================================================
-// FILE SCANNING
-// =============================================================================
-
-async function scanFile(filePath, patterns = SECRET_PATTERNS) {
-  const findings = [];
-
-  try {
-    const content = fs.readFileSync(filePath, 'utf-8');
-    const lines = content.split('\n');
-
-    for (let lineNum = 0; lineNum < lines.length; lineNum++) {
-      const line = lines[lineNum];
-
-      // Inline suppression: # ship-safe-ignore on the same line
-      if (/ship-safe-ignore/i.test(line)) continue;
-
-      for (const pattern of patterns) {
-        // Reset regex state (important for global regexes)
-        pattern.pattern.lastIndex = 0;
-
-        let match;
-        while ((match = pattern.pattern.exec(line)) !== null) {
-          // For generic patterns, apply entropy check to filter placeholders
-          if (pattern.requiresEntropyCheck && !isHighEntropyMatch(match[0])) {
-            continue;
-          }
-
-          const confidence = getConfidence(pattern, match[0]);
-
-          findings.push({
-            line: lineNum + 1,
-            column: match.index + 1,
-            matched: match[0],
-            patternName: pattern.name,
-            severity: pattern.severity,
-            confidence,
-            description: pattern.description,
-            category: pattern.category || 'secret'
-          });
-        }
-      }
-    }
-  } catch {
-    // Skip files that can't be read (binary, permissions, etc.)
-  }
-
-  // Deduplicate: multiple patterns can match the same secret on the same line
-  // (e.g. Stripe and Clerk both match sk_live_...). Keep one finding per
-  // unique (line, matched-text) pair — first match wins (patterns are ordered
-  // by severity: critical → high → medium).
-  const seen = new Set();
-  return findings.filter(f => {
-    const key = `${f.line}:${f.matched}`;
-    if (seen.has(key)) return false;
-    seen.add(key);
-    return true;
-  });
+  return { files: filtered, stats };
 }
 
 // =============================================================================
@@ -425,34 +391,39 @@ function outputPretty(results, filesScanned, rootPath) {
     console.log(chalk.gray('Tip:  Run with --include-tests to also scan test files.'));
     console.log(chalk.gray('Tip:  Add a .ship-safeignore file to exclude paths.'));
   } else {
+    // Findings can run to thousands of lines; build them up and write once
+    const lines = [];
+
     // ── Secrets section ────────────────────────────────────────────────────
     if (secretResults.length > 0) {
-      console.log();
-      console.log(chalk.red.bold(`  Secrets (${stats.secretsTotal})`));
-      console.log(chalk.red('  ' + '─'.repeat(58)));
+      lines.push('');
+      lines.push(chalk.red.bold(`  Secrets (${stats.secretsTotal})`));
+      lines.push(chalk.red('  ' + '─'.repeat(58)));
 
       for (const { file, findings } of secretResults) {
         const relPath = path.relative(rootPath, file);
         for (const f of findings) {
-          output.finding(relPath, f.line, f.patternName, f.severity, f.matched, f.description, f.confidence);
+          lines.push(output.formatFinding(relPath, f.line, f.patternName, f.severity, f.matched, f.description, f.confidence));
         }
       }
     }
 
     // ── Code Vulnerabilities section ───────────────────────────────────────
     if (vulnResults.length > 0) {
-      console.log();
-      console.log(chalk.yellow.bold(`  Code Vulnerabilities (${stats.vulnsTotal})`));
-      console.log(chalk.yellow('  ' + '─'.repeat(58)));
+      lines.push('');
+      lines.push(chalk.yellow.bold(`  Code Vulnerabilities (${stats.vulnsTotal})`));
+      lines.push(chalk.yellow('  ' + '─'.repeat(58)));
 
       for (const { file, findings } of vulnResults) {
         const relPath = path.relative(rootPath, file);
         for (const f of findings) {
-          output.vulnerabilityFinding(relPath, f.line, f.patternName, f.severity, f.matched, f.description);
+          lines.push(output.formatVulnerabilityFinding(relPath, f.line, f.patternName, f.severity, f.matched, f.description));
         }
       }
     }
 
+    process.stdout.write(lines.join('\n') + '\n');
+
     // Remind about suppressions
     console.log();
     console.log(chalk.gray('Suppress a finding: add  # ship-safe-ignore  as a comment on that line'));
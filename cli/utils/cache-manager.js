@@ -5,6 +5,11 @@
  * Provides incremental scanning by caching file hashes and findings.
  * On subsequent runs, only changed files are re-scanned.
  *
+ * A file whose size and mtime match the cache is taken as unchanged without
+ * being read, unless it was modified within RACY_WINDOW_MS of being hashed —
+ * filesystems with coarse timestamps can give an edit made right after
+ * hashing the same mtime, so those files are hashed again.
+ *
  * Cache location: .ship-safe/context.json
  *
  * USAGE:
@@ -30,6 +35,9 @@ const PACKAGE_VERSION = JSON.parse(readFileSync(join(__dirname, '../../package.j
 // Cache TTL: 24 hours
 const CACHE_TTL_MS = 24 * 60 * 60 * 1000;
 
+// mtime granularity is 2s on FAT, 1s on older ext and HFS+
+const RACY_WINDOW_MS = 2000;
+
 export class CacheManager {
   /**
    * @param {string} rootPath — Absolute path to project root
@@ -39,6 +47,8 @@ export class CacheManager {
     this.cacheDir = path.join(rootPath, '.ship-safe');
     this.cachePath = path.join(this.cacheDir, 'context.json');
     this.cache = null;
+    // File index entries confirmed unchanged by diff(), reused by save()
+    this.unchanged = new Map();
   }
 
   /**
@@ -81,9 +91,12 @@ export class CacheManager {
    * Compare current files against cached file index to find what changed.
    *
    * @param {string[]} currentFiles — Array of absolute file paths
+   * @param {Map<string, fs.Stats>} [statsByFile] — Stats already collected for these files
    * @returns {{ changedFiles: string[], cachedFindings: object[], unchangedCount: number, newCount: number, modifiedCount: number, deletedCount: number }}
    */
-  diff(currentFiles) {
+  diff(currentFiles, statsByFile) {
+    this.unchanged = new Map();
+
     if (!this.cache || !this.cache.fileIndex) {
       return {
         changedFiles: currentFiles,
@@ -117,8 +130,9 @@ export class CacheManager {
       }
 
       // Quick size check before expensive hash
+      let stats;
       try {
-        const stats = fs.statSync(file);
+        stats = statsByFile?.get(file) ?? fs.statSync(file);
         if (stats.size !== cached.size) {
           changedFiles.push(file);
           modifiedCount++;
@@ -130,16 +144,22 @@ export class CacheManager {
         continue;
       }
 
-      // Hash check
-      const currentHash = this.hashFile(file);
-      if (currentHash !== cached.hash) {
+      // Hash check, unless mtime shows the file hasn't been touched since it was hashed
+      const rehashed = !this.isStatUnchanged(stats, cached);
+      if (rehashed && this.hashFile(file) !== cached.hash) {
         changedFiles.push(file);
         modifiedCount++;
         continue;
       }
 
-      // File unchanged — reuse cached findings
+      // File unchanged — reuse cached findings. A file just re-hashed
+      // records when, or a new mtime would keep failing the racy check.
       unchangedCount++;
+      this.unchanged.set(relPath, {
+        ...cached,
+        mtimeMs: stats.mtimeMs,
+        ...(rehashed && { lastScanned: new Date().toISOString() }),
+      });
       if (cachedFindings[relPath]) {
         // Restore absolute paths for cached findings
         for (const finding of cachedFindings[relPath]) {
@@ -164,6 +184,15 @@ export class CacheManager {
     };
   }
 
+  /**
+   * Whether a file's stats show it hasn't changed since its cache entry was hashed.
+   */
+  isStatUnchanged(stats, cached) {
+    if (cached.mtimeMs === undefined || stats.mtimeMs !== cached.mtimeMs) return false;
+    const hashedAt = new Date(cached.lastScanned).getTime();
+    return stats.mtimeMs + RACY_WINDOW_MS < hashedAt;
+  }
+
   /**
    * Save the cache to disk.
    *
@@ -179,22 +208,30 @@ export class CacheManager {
         fs.mkdirSync(this.cacheDir, { recursive: true });
       }
 
-      // Build file index with hashes
+      // Build file index with hashes. Files diff() found unchanged keep their
+      // entry; the rest are stat'ed before hashing, so an edit made while
+      // hashing leaves a newer mtime and is caught next run.
       const fileIndex = {};
       for (const file of allFiles) {
         const relPath = path.relative(this.rootPath, file).replace(/\\/g, '/');
-        const hash = this.hashFile(file);
-        if (hash) {
-          try {
-            const stats = fs.statSync(file);
+        const unchanged = this.unchanged.get(relPath);
+        if (unchanged) {
+          fileIndex[relPath] = unchanged;
+          continue;
+        }
+        try {
+          const stats = fs.statSync(file);
+          const hash = this.hashFile(file);
+          if (hash) {
             fileIndex[relPath] = {
               hash,
               size: stats.size,
+              mtimeMs: stats.mtimeMs,
               lastScanned: new Date().toISOString(),
             };
-          } catch {
-            // Skip files we can't stat
           }
+        } catch {
+          // Skip files we can't stat
         }
       }
 
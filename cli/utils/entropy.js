@@ -48,6 +48,21 @@ export const ENTROPY_THRESHOLD = 3.5;
 // Strings shorter than this are unreliable for entropy analysis
 const MIN_ENTROPY_LENGTH = 16;
 
+// Common placeholder values, built once rather than on every match
+const PLACEHOLDER_PATTERNS = [
+  /^(your[-_]?|my[-_]?|example[-_]?|test[-_]?|dummy[-_]?|fake[-_]?|sample[-_]?)/i,
+  /^(xxx+|yyy+|zzz+|aaa+|000+)/i,
+  /^(insert|replace|changeme|placeholder|todo|fixme)/i,
+  /([-_]here|[-_]goes|[-_]key|[-_]token|[-_]secret)$/i,
+  /^[a-z]+[-_][a-z]+[-_][a-z]+$/, // looks like-a-passphrase not a key
+  /^(add[-_]?your|put[-_]?your|enter[-_]?your|set[-_]?your)/i,
+  /^(secret|password|token|apikey|api_key|key|value)[-_]?[0-9]*$/i,
+  /^(n\/a|null|undefined|none|empty|blank)/i,
+  /^(demo|staging|dev|development|local)[-_]/i,
+  /^(abcdef|qwerty|asdfgh|123456|letmein)/i,
+  /(.)\1{5,}/, // 6+ repeated chars: aaaaaaa, 111111
+];
+
 // =============================================================================
 // VALUE EXTRACTION
 // =============================================================================
@@ -94,20 +109,6 @@ export function isHighEntropyMatch(matched) {
   if (!value || value.length < MIN_ENTROPY_LENGTH) return true;
 
   // Common placeholder patterns - fast path rejection
-  const PLACEHOLDER_PATTERNS = [
-    /^(your[-_]?|my[-_]?|example[-_]?|test[-_]?|dummy[-_]?|fake[-_]?|sample[-_]?)/i,
-    /^(xxx+|yyy+|zzz+|aaa+|000+)/i,
-    /^(insert|replace|changeme|placeholder|todo|fixme)/i,
-    /([-_]here|[-_]goes|[-_]key|[-_]token|[-_]secret)$/i,
-    /^[a-z]+[-_][a-z]+[-_][a-z]+$/, // looks like-a-passphrase not a key
-    /^(add[-_]?your|put[-_]?your|enter[-_]?your|set[-_]?your)/i,
-    /^(secret|password|token|apikey|api_key|key|value)[-_]?[0-9]*$/i,
-    /^(n\/a|null|undefined|none|empty|blank)/i,
-    /^(demo|staging|dev|development|local)[-_]/i,
-    /^(abcdef|qwerty|asdfgh|123456|letmein)/i,
-    /(.)\1{5,}/, // 6+ repeated chars: aaaaaaa, 111111
-  ];
-
   if (PLACEHOLDER_PATTERNS.some(p => p.test(value))) return false;
 
   const entropy = shannonEntropy(value);
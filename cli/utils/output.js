@@ -88,32 +88,51 @@ const confidenceColors = {
  * Print a finding (secret detected)
  */
 export function finding(file, line, patternName, severity, matched, description, confidence) {
+  console.log(formatFinding(file, line, patternName, severity, matched, description, confidence));
+}
+
+/**
+ * Render a finding as printed by finding(), for callers that batch output
+ */
+export function formatFinding(file, line, patternName, severity, matched, description, confidence) {
   const color = severityColors[severity] || chalk.white;
   const icon = severityIcons[severity] || '';
   const confColor = confidenceColors[confidence] || chalk.gray;
   const confLabel = confidence ? `  ${chalk.gray('Confidence:')} ${confColor(confidence)}` : '';
 
-  console.log();
-  console.log(chalk.white.bold(`${file}:${line}`));
-  console.log(`  ${icon}${color(`[${severity.toUpperCase()}]`)} ${chalk.white(patternName)}`);
-  console.log(`  ${chalk.gray('Found:')} ${chalk.yellow(maskSecret(matched))}`);
-  if (confLabel) console.log(confLabel);
-  console.log(`  ${chalk.gray('Why:')} ${description}`);
+  const lines = [
+    '',
+    chalk.white.bold(`${file}:${line}`),
+    `  ${icon}${color(`[${severity.toUpperCase()}]`)} ${chalk.white(patternName)}`,
+    `  ${chalk.gray('Found:')} ${chalk.yellow(maskSecret(matched))}`,
+  ];
+  if (confLabel) lines.push(confLabel);
+  lines.push(`  ${chalk.gray('Why:')} ${description}`);
+  return lines.join('\n');
 }
 
 /**
  * Print a vulnerability finding (code issue — show matched code, not masked)
  */
 export function vulnerabilityFinding(file, line, patternName, severity, matched, description) {
+  console.log(formatVulnerabilityFinding(file, line, patternName, severity, matched, description));
+}
+
+/**
+ * Render a vulnerability finding as printed by vulnerabilityFinding()
+ */
+export function formatVulnerabilityFinding(file, line, patternName, severity, matched, description) {
   const color = severityColors[severity] || chalk.white;
   const icon = severityIcons[severity] || '';
   const snippet = matched.length > 80 ? matched.slice(0, 80) + '…' : matched;
 
-  console.log();
-  console.log(chalk.white.bold(`${file}:${line}`));
-  console.log(`  ${icon}${color(`[${severity.toUpperCase()}]`)} ${chalk.white(patternName)}`);
-  console.log(`  ${chalk.gray('Code:')}  ${chalk.cyan(snippet)}`);
-  console.log(`  ${chalk.gray('Why:')}  ${description}`);
+  return [
+    '',
+    chalk.white.bold(`${file}:${line}`),
+    `  ${icon}${color(`[${severity.toUpperCase()}]`)} ${chalk.white(patternName)}`,
+    `  ${chalk.gray('Code:')}  ${chalk.cyan(snippet)}`,
+    `  ${chalk.gray('Why:')}  ${description}`,
+  ].join('\n');
 }
 
 /**
@@ -0,0 +1,517 @@
+/**
+ * Pattern Matcher
+ * ===============
+ *
+ * Runs the scan command's secret and vulnerability patterns over file content.
+ *
+ * Checking every pattern against every line costs lines × patterns regex
+ * calls, and nearly all of them fail: most lines of most files contain no
+ * secret at all. So the whole file is first run through two cheap passes: a
+ * search for the fixed prefixes most key formats start with, and one
+ * alternation of the patterns that have none. Only a line either pass
+ * flags is handed to the individual patterns, and its line number comes
+ * from the match offset rather than from splitting the file.
+ *
+ * The alternation is a gate, not the matcher. It reports one match per
+ * position, so a generic `api_key = "sk-..."` assignment would hide the
+ * OpenAI key inside it. Running the individual patterns on the lines it
+ * flags keeps findings identical to checking every pattern on every line.
+ *
+ * ENGINE:
+ * The gate is an ordinary RegExp on purpose. Native multi-pattern engines
+ * (Hyperscan, Vectorscan) would report every pattern's matches in a single
+ * pass, but they are C++ addons: a prebuilt binary per platform that
+ * `npx ship-safe` would have to download and that fails to install on some
+ * of them, and the `re2` addon's linear-time engine has the same problem.
+ * V8's own linear-time engine (`--enable-experimental-regexp-engine`) is not
+ * an option either, as it rejects the `i` flag and any counted repetition
+ * above 16, which covers most key formats. Revisit if either changes; the
+ * gate is the only place that would need to. Where a DFA is available
+ * without an addon, ripgrep on PATH, it picks which files to read instead
+ * (see ripgrep.js). Without one, the patterns themselves must stay linear:
+ * no unbounded class that can run past the token it belongs to.
+ *
+ * USAGE:
+ *   import { compilePatterns, scanContent } from './pattern-matcher.js';
+ *   const matcher = compilePatterns([...SECRET_PATTERNS, ...SECURITY_PATTERNS]);
+ *   const findings = scanContent(fs.readFileSync(file, 'utf-8'), matcher);
+ */
+
+import { isHighEntropyMatch, getConfidence } from './entropy.js';
+
+// A pattern can only join the alternation if its source means the same thing
+// there. Backreferences are numbered across the whole regex and named groups
+// must be unique in it, so either would change meaning once concatenated. A
+// negative lookaround can fail at a line end that the patterns, run on the
+// line alone, would pass, so those stay out too.
+const UNION_UNSAFE = /\\[1-9]|\\k<|\(\?<(?![=!])|\(\?<?!/;
+
+// Shorter literals occur too often in ordinary code to narrow anything down.
+const MIN_LITERAL_LENGTH = 3;
+
+// =============================================================================
+// COMPILATION
+// =============================================================================
+
+/**
+ * Compile a pattern list into a matcher.
+ *
+ * Most key formats start with a fixed prefix (`AKIA`, `ghp_`, `sk_live_`),
+ * and the literal prefilter finds those with a plain string alternation,
+ * which is much cheaper per character than the patterns themselves. A
+ * prefix hit only flags its line once the pattern that owns the prefix
+ * actually matches there, so common short prefixes like `re_` do not send
+ * every line that mentions `store_id` to the individual patterns.
+ *
+ * Patterns without a usable literal go into the gate alternations instead.
+ * JavaScript has no inline case-insensitivity flag, so case-sensitive and
+ * `i` patterns get separate alternations (and separate prefilters).
+ * Patterns that cannot be combined (other flags, backreferences, named
+ * groups, negative lookarounds) are checked on every line.
+ *
+ * @param {object[]} patterns — { name, pattern: RegExp, severity, ... }
+ * @returns {{ patterns: object[], prefilters: object[], gates: RegExp[], ungated: object[] }}
+ */
+export function compilePatterns(patterns) {
+  const sensitive = { literals: new Map(), gate: [] };
+  const insensitive = { literals: new Map(), gate: [] };
+  const ungated = [];
+
+  for (const p of patterns) {
+    const { source, flags } = p.pattern;
+    const extra = flags.replace(/[gi]/g, '');
+    if (extra || UNION_UNSAFE.test(source)) {
+      ungated.push(p);
+      continue;
+    }
+
+    const ci = flags.includes('i');
+    const group = ci ? insensitive : sensitive;
+    const confined = confineToLine(source);
+    const literals = requiredLiterals(source);
+
+    if (literals && literals.every(l => l.length >= MIN_LITERAL_LENGTH)) {
+      const confirm = new RegExp(confined, ci ? 'i' : '');
+      for (const literal of literals) {
+        const key = ci ? literal.toLowerCase() : literal;
+        if (!group.literals.has(key)) group.literals.set(key, new Set());
+        group.literals.get(key).add(confirm);
+      }
+    } else {
+      group.gate.push(`(?:${confined})`);
+    }
+  }
+
+  const prefilters = [];
+  const gates = [];
+  for (const [group, ci] of [[sensitive, false], [insensitive, true]]) {
+    if (group.literals.size > 0) prefilters.push(buildPrefilter(group.literals, ci));
+    if (group.gate.length > 0) gates.push(new RegExp(group.gate.join('|'), ci ? 'gim' : 'gm'));
+  }
+
+  return { patterns, prefilters, gates, ungated };
+}
+
+/**
+ * Build one literal prefilter: an alternation of every literal, longest
+ * first, plus the patterns to confirm for each.
+ *
+ * Longest first means a hit reports the longest literal at that position.
+ * Any shorter literal matching at the same position is a prefix of it, so
+ * each literal's owners include the owners of its prefixes.
+ */
+function buildPrefilter(literals, ci) {
+  const keys = [...literals.keys()].sort((a, b) => b.length - a.length);
+  const owners = new Map();
+  for (const key of keys) {
+    const confirms = new Set();
+    for (const other of keys) {
+      if (key.startsWith(other)) literals.get(other).forEach(c => confirms.add(c));
+    }
+    owners.set(key, [...confirms]);
+  }
+  const source = keys.map(k => k.replace(/[.*+?^${}()|[\]\\/]/g, '\\$&')).join('|');
+  return {
+    regex: new RegExp(source, ci ? 'gi' : 'g'),
+    sticky: new RegExp(source, ci ? 'iy' : 'y'),
+    ci,
+    owners,
+    ...prefixTable(keys, ci),
+  };
+}
+
+/**
+ * Bit set of every literal's first three characters, 7 bits each packed into
+ * one 21-bit integer, for nextLiteral to test a window of content against.
+ *
+ * Characters are masked to 7 bits, and for `i` prefilters ASCII letters are
+ * folded to lower case, the same way on both sides, so a collision only costs
+ * a wasted regex attempt. Non-ASCII case pairs don't fold that way, so an `i`
+ * prefilter with one in a prefix gets no table and is searched by regex.
+ */
+function prefixTable(keys, ci) {
+  const fold = ci ? 0x20 : 0;
+  if (ci && keys.some(key => /[^\x00-\x7f]/.test(key.slice(0, 3)))) return { prefixes: null, fold };
+
+  const prefixes = new Int32Array(1 << 16);
+  for (const key of keys) {
+    let window = 0;
+    for (let j = 0; j < 3; j++) window = (window << 7) | (key.charCodeAt(j) & 127) | fold;
+    prefixes[window >>> 5] |= 1 << (window & 31);
+  }
+  return { prefixes, fold };
+}
+
+/**
+ * Literal strings at least one of which appears in every match of a regex
+ * source, or null if no such set can be read off it.
+ *
+ * Only the common shapes are understood: a run of plain characters
+ * (`sk_live_`), or a group of plain alternatives (`(?:cohere|COHERE)`).
+ * Anything else just ends the current run, so the answer is always safe,
+ * at worst unhelpfully short.
+ */
+export function requiredLiterals(source) {
+  const result = [];
+  for (const alternative of splitAlternatives(source)) {
+    let best = null;
+    let run = '';
+    const endRun = () => {
+      if (run && (!best || run.length > minLength(best))) best = [run];
+      run = '';
+    };
+
+    for (let i = 0; i < alternative.length;) {
+      const atom = readAtom(alternative, i);
+      const quantifier = readQuantifier(alternative, atom.end);
+      i = quantifier.end;
+
+      if (atom.literal !== undefined && quantifier.min > 0) {
+        run += atom.literal;
+        if (quantifier.text) endRun();
+      } else if (atom.choices && quantifier.min > 0) {
+        endRun();
+        if (!best || minLength(atom.choices) > minLength(best)) best = atom.choices;
+      } else {
+        endRun();
+      }
+    }
+    endRun();
+
+    if (!best) return null;
+    result.push(...best);
+  }
+  return result;
+}
+
+function minLength(strings) {
+  return Math.min(...strings.map(s => s.length));
+}
+
+// Escapes that stand for a class, an assertion, or a control character
+// rather than the character itself.
+const NON_LITERAL_ESCAPES = /[dDwWsSbBnrtfv0-9cxuk]/;
+
+/**
+ * Read one atom at `i`: { end, literal } for a plain character, { end,
+ * choices } for a group of plain alternatives, or { end } for anything else.
+ */
+function readAtom(source, i) {
+  const ch = source[i];
+  if (ch === '\\') {
+    const next = source[i + 1];
+    return NON_LITERAL_ESCAPES.test(next) ? { end: escapeEnd(source, i) } : { end: i + 2, literal: next };
+  }
+  if (ch === '[') {
+    let j = i + 1;
+    while (j < source.length && source[j] !== ']') j += source[j] === '\\' ? 2 : 1;
+    return { end: j + 1 };
+  }
+  if (ch === '(') {
+    const end = closingParen(source, i);
+    const body = source.slice(i + 1, end);
+    if (body.startsWith('?') && !body.startsWith('?:')) return { end: end + 1 };
+    const alternatives = splitAlternatives(body.startsWith('?:') ? body.slice(2) : body);
+    const plain = alternatives.every(a => a && /^(?:[^\\[\](){}.*+?|^$]|\\[^dDwWsSbBnrtfv0-9cxuk])+$/.test(a));
+    if (!plain) return { end: end + 1 };
+    return { end: end + 1, choices: alternatives.map(a => a.replace(/\\(.)/g, '$1')) };
+  }
+  if ('.^$|'.includes(ch)) return { end: i + 1 };
+  return { end: i + 1, literal: ch };
+}
+
+/**
+ * End of the non-literal escape at `i`. Hex and Unicode escapes, control
+ * escapes, backreferences and named backreferences run past the letter
+ * after the backslash, and what follows it is part of the escape, not text.
+ */
+function escapeEnd(source, i) {
+  const rest = source.slice(i + 1);
+  const m = /^(?:x[0-9A-Fa-f]{2}|u[0-9A-Fa-f]{4}|u\{[0-9A-Fa-f]+\}|c[A-Za-z]|[0-9]+|k<[^>]*>)/.exec(rest);
+  return i + 1 + (m ? m[0].length : 1);
+}
+
+/**
+ * Read an optional quantifier at `i`: { end, min, text }.
+ */
+function readQuantifier(source, i) {
+  const m = /^(?:[?*+]|\{(\d+)(?:,\d*)?\})\??/.exec(source.slice(i, i + 16));
+  if (!m) return { end: i, min: 1, text: '' };
+  const min = m[0][0] === '+' ? 1 : m[1] !== undefined ? Number(m[1]) : 0;
+  return { end: i + m[0].length, min, text: m[0] };
+}
+
+function closingParen(source, i) {
+  let depth = 0;
+  for (let j = i; j < source.length; j++) {
+    const ch = source[j];
+    if (ch === '\\') j++;
+    else if (ch === '[') j = readAtom(source, j).end - 1;
+    else if (ch === '(') depth++;
+    else if (ch === ')' && --depth === 0) return j;
+  }
+  return source.length;
+}
+
+/**
+ * Split a source on its top-level `|`.
+ */
+function splitAlternatives(source) {
+  const parts = [];
+  let depth = 0;
+  let start = 0;
+  for (let j = 0; j < source.length; j++) {
+    const ch = source[j];
+    if (ch === '\\') j++;
+    else if (ch === '[') j = readAtom(source, j).end - 1;
+    else if (ch === '(') depth++;
+    else if (ch === ')') depth--;
+    else if (ch === '|' && depth === 0) {
+      parts.push(source.slice(start, j));
+      start = j + 1;
+    }
+  }
+  parts.push(source.slice(start));
+  return parts;
+}
+
+/**
+ * Stop negated character classes from matching a newline.
+ *
+ * Run on a single line, `[^@]+` can never see past the end of it. Run over
+ * the whole file it can, and every attempt after `postgres://` would then
+ * scan ahead to the next `@` anywhere below. Excluding the newline keeps
+ * each attempt bounded by its line, as it was when files were split.
+ */
+function confineToLine(source) {
+  let out = '';
+  let inClass = false;
+  for (let i = 0; i < source.length; i++) {
+    const ch = source[i];
+    if (ch === '\\') {
+      out += ch + source[++i];
+    } else if (!inClass && ch === '[') {
+      inClass = true;
+      if (source[i + 1] === '^') {
+        out += '[^\\n';
+        i++;
+      } else {
+        out += ch;
+      }
+    } else {
+      if (ch === ']') inClass = false;
+      out += ch;
+    }
+  }
+  return out;
+}
+
+// =============================================================================
+// MATCHING
+// =============================================================================
+
+/**
+ * Scan file content and return findings, one per unique (line, matched text).
+ */
+export function scanContent(content, matcher) {
+  return toFindings(matchContent(content, matcher), matcher.patterns);
+}
+
+/**
+ * Scan file content and return compact matches, one per unique (line,
+ * matched text): [line, column, matched, patternIndex, confidence].
+ *
+ * Pattern names and descriptions stay out of the matching loop and, in the
+ * scan pool, out of the messages workers send back; toFindings fills them in.
+ */
+export function matchContent(content, matcher) {
+  const { patterns, prefilters, gates, ungated } = matcher;
+  const matches = [];
+
+  // indexOf searches with memchr-style word scans, far faster than
+  // checking each character from JavaScript.
+  const newlines = [];
+  for (let i = content.indexOf('\n'); i !== -1; i = content.indexOf('\n', i + 1)) {
+    newlines.push(i);
+  }
+  const lineCount = newlines.length + 1;
+
+  // Line numbers (0-based) that need the individual patterns. After a hit
+  // each scan resumes at the start of the next line: the rest of this line
+  // is checked by the individual patterns anyway.
+  const gated = new Set();
+
+  for (const prefilter of prefilters) {
+    const { ci, owners } = prefilter;
+    const tried = new Map();
+    let from = 0;
+    let match;
+    while ((match = nextLiteral(prefilter, content, from)) !== null) {
+      const lineNum = lineIndexOf(newlines, match.index);
+      if (!gated.has(lineNum)) {
+        // Confirm each owning pattern once per line, however often its
+        // literal repeats there.
+        const key = ci ? match[0].toLowerCase() : match[0];
+        if (!tried.has(lineNum)) tried.set(lineNum, new Set());
+        const triedOnLine = tried.get(lineNum);
+        if (!triedOnLine.has(key)) {
+          triedOnLine.add(key);
+          const line = lineAt(content, newlines, lineNum);
+          if (owners.get(key).some(confirm => confirm.test(line))) gated.add(lineNum);
+        }
+      }
+      if (!gated.has(lineNum)) {
+        // Literals can overlap (`AAAA…` then `AKIA`), so step one character.
+        from = match.index + 1;
+      } else if (lineNum === newlines.length) {
+        break;
+      } else {
+        from = newlines[lineNum] + 1;
+      }
+    }
+  }
+
+  for (const gate of gates) {
+    gate.lastIndex = 0;
+    let match;
+    while ((match = gate.exec(content)) !== null) {
+      const lineNum = lineIndexOf(newlines, match.index);
+      gated.add(lineNum);
+      if (lineNum === newlines.length) break;
+      gate.lastIndex = newlines[lineNum] + 1;
+    }
+  }
+
+  if (gated.size === 0 && ungated.length === 0) return matches;
+
+  const lineNums = ungated.length > 0
+    ? Array.from({ length: lineCount }, (_, i) => i)
+    : [...gated].sort((a, b) => a - b);
+
+  const allIndexes = patterns.map((_, i) => i);
+  const ungatedIndexes = ungated.map(pattern => patterns.indexOf(pattern));
+
+  for (const lineNum of lineNums) {
+    const line = lineAt(content, newlines, lineNum);
+
+    // Inline suppression: # ship-safe-ignore on the same line
+    if (/ship-safe-ignore/i.test(line)) continue;
+
+    for (const index of gated.has(lineNum) ? allIndexes : ungatedIndexes) {
+      const pattern = patterns[index];
+      // Reset regex state (important for global regexes)
+      pattern.pattern.lastIndex = 0;
+
+      let match;
+      while ((match = pattern.pattern.exec(line)) !== null) {
+        // For generic patterns, apply entropy check to filter placeholders
+        if (pattern.requiresEntropyCheck && !isHighEntropyMatch(match[0])) {
+          continue;
+        }
+
+        const confidence = getConfidence(pattern, match[0]);
+
+        matches.push([lineNum + 1, match.index + 1, match[0], index, confidence]);
+      }
+    }
+  }
+
+  // Deduplicate: multiple patterns can match the same secret on the same line
+  // (e.g. Stripe and Clerk both match sk_live_...). Keep one finding per
+  // unique (line, matched-text) pair — first match wins (patterns are ordered
+  // by severity: critical → high → medium).
+  const seen = new Set();
+  return matches.filter(([line, , matched]) => {
+    const key = `${line}:${matched}`;
+    if (seen.has(key)) return false;
+    seen.add(key);
+    return true;
+  });
+}
+
+/**
+ * Find the first literal of a prefilter at or after `from`.
+ *
+ * Searching with the alternation makes the regex engine try every literal at
+ * every position. Instead, slide a window of the last three characters along
+ * the content, packed like prefixTable's entries, and only try the literals,
+ * anchored, where the table says one could start. That is a shift and one
+ * bit test per character, and ordinary text rarely passes it.
+ */
+function nextLiteral({ regex, sticky, prefixes, fold }, content, from) {
+  if (prefixes === null) {
+    regex.lastIndex = from;
+    return regex.exec(content);
+  }
+
+  let window = (((content.charCodeAt(from) & 127) | fold) << 7) | (content.charCodeAt(from + 1) & 127) | fold;
+  for (let i = from + 2; i < content.length; i++) {
+    window = ((window << 7) | (content.charCodeAt(i) & 127) | fold) & 0x1fffff;
+    if (prefixes[window >>> 5] & (1 << (window & 31))) {
+      sticky.lastIndex = i - 2;
+      const match = sticky.exec(content);
+      if (match !== null) return match;
+    }
+  }
+  return null;
+}
+
+/**
+ * Expand compact matches from matchContent into findings.
+ */
+export function toFindings(matches, patterns) {
+  return matches.map(([line, column, matched, index, confidence]) => {
+    const pattern = patterns[index];
+    return {
+      line,
+      column,
+      matched,
+      patternName: pattern.name,
+      severity: pattern.severity,
+      confidence,
+      description: pattern.description,
+      category: pattern.category || 'secret'
+    };
+  });
+}
+
+/**
+ * 0-based line number of a character offset, by binary search over the
+ * offsets of every newline in the file.
+ */
+function lineIndexOf(newlines, offset) {
+  let lo = 0;
+  let hi = newlines.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (newlines[mid] < offset) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+function lineAt(content, newlines, lineNum) {
+  const start = lineNum === 0 ? 0 : newlines[lineNum - 1] + 1;
+  const end = lineNum < newlines.length ? newlines[lineNum] : content.length;
+  return content.slice(start, end);
+}
@@ -105,13 +105,13 @@ export const SECRET_PATTERNS = [
   },
   {
     name: 'Neon Database Connection String',
-    pattern: /postgres(ql)?:\/\/[^:]+:[^@]+@[^.]+\.neon\.tech/g,
+    pattern: /postgres(ql)?:\/\/[^\s"':]+:[^\s"'@]+@[^.\s"']+\.neon\.tech/g,
     severity: 'critical',
     description: 'Neon Postgres connection strings contain database credentials.'
   },
   {
     name: 'MongoDB Atlas Connection String',
-    pattern: /mongodb(\+srv)?:\/\/[^:]+:[^@]+@[^.]+\.mongodb\.net/g,
+    pattern: /mongodb(\+srv)?:\/\/[^\s"':]+:[^\s"'@]+@[^.\s"']+\.mongodb\.net/g,
     severity: 'critical',
     description: 'MongoDB Atlas connection strings contain database credentials.'
   },
@@ -299,7 +299,7 @@ export const SECRET_PATTERNS = [
   },
   {
     name: 'Turso Database URL',
-    pattern: /libsql:\/\/[^.]+\.turso\.io/g,
+    pattern: /libsql:\/\/[^.\s"']+\.turso\.io/g,
     severity: 'high',
     description: 'Turso database URLs. Check for embedded auth tokens in full connection string.'
   },
@@ -385,7 +385,7 @@ export const SECRET_PATTERNS = [
   },
   {
     name: 'Auth0 Domain with Credentials',
-    pattern: /https:\/\/[^.]+\.auth0\.com.*client_secret/gi,
+    pattern: /https:\/\/[^.\s"']+\.auth0\.com.*client_secret/gi,
     severity: 'critical',
     description: 'Auth0 URLs with embedded client secrets should never be in code.'
   },
@@ -724,7 +724,11 @@ export const SECRET_PATTERNS = [
   },
   {
     name: 'Database URL with Credentials',
-    pattern: /(mongodb|postgres|postgresql|mysql|redis):\/\/[^:]+:[^@]+@[^\s"']+/gi,
+    // User and password stop at whitespace and quotes, as they must in a real
+    // URL. With a bare [^:]+:[^@]+ every scheme on a line scanned to the end
+    // of it looking for an @, so a minified line of credential-free URLs took
+    // seconds. The Neon and Atlas patterns above are bounded the same way.
+    pattern: /(mongodb|postgres|postgresql|mysql|redis):\/\/[^\s"':]+:[^\s"'@]+@[^\s"']+/gi,
     severity: 'medium',
     requiresEntropyCheck: true,
     description: 'Database URLs with embedded passwords expose your database.'
@@ -941,6 +945,15 @@ export function loadShipSafeIgnorePatterns(rootPath) {
   }
 }
 
+/**
+ * Fast-glob ignore patterns from the project's root `.gitignore`.
+ *
+ * In .gitignore a pattern that matches a directory excludes everything under
+ * it, so every non-directory entry also gets a `/**` form. Fast-glob only
+ * prunes a directory from the walk on ignore patterns ending in `/**`;
+ * without that form `/build` or `*.egg-info` were still read in full and
+ * every file under them stat'ed, then mostly kept.
+ */
 export function loadGitignorePatterns(rootPath) {
   const gitignorePath = path.join(rootPath, '.gitignore');
   try {
@@ -951,20 +964,12 @@ export function loadGitignorePatterns(rootPath) {
       .filter(l => l && !l.startsWith('#') && !l.startsWith('!'))
       .filter(p => !isSecuritySensitive(p))
       .map(p => {
-        // Convert .gitignore patterns to fast-glob ignore patterns
-        if (p.startsWith('/')) {
-          // Rooted pattern: /build → build/**
-          return p.slice(1) + (p.endsWith('/') ? '**' : '');
-        }
-        if (p.endsWith('/')) {
-          // Directory pattern: logs/ → **/logs/**
-          return `**/${p}**`;
-        }
-        // General pattern: *.log → **/*.log, dist → **/dist, **/dist/**
-        if (!p.includes('/') && !p.includes('*')) {
-          return [`**/${p}`, `**/${p}/**`];
-        }
-        return `**/${p}`;
+        // Convert .gitignore patterns to fast-glob ignore patterns:
+        //   /build → build, build/**     logs/ → **/logs/**
+        //   *.log  → **/*.log, **/*.log/**
+        const body = p.replace(/^\//, '').replace(/\/$/, '');
+        const glob = p.startsWith('/') ? body : `**/${body}`;
+        return p.endsWith('/') ? `${glob}/**` : [glob, `${glob}/**`];
       })
       .flat();
   } catch {
@@ -1186,6 +1191,9 @@ export const TEST_FILE_PATTERNS = [
   /\.mock\.[jt]sx?$/,
 ];
 
+// Every discovered file is checked, so the patterns run as one regex
+const TEST_FILE_RE = new RegExp(TEST_FILE_PATTERNS.map(p => p.source).join('|'));
+
 /**
  * Is this path test, fixture, or mock code?
  *
@@ -1200,7 +1208,7 @@ export const TEST_FILE_PATTERNS = [
  * and 2 in `lib/`. A test app that skips security headers is not a defect.
  */
 export function isTestFile(filePath) {
-  return TEST_FILE_PATTERNS.some((pattern) => pattern.test(filePath));
+  return TEST_FILE_RE.test(filePath);
 }
 
 /**
@@ -1214,6 +1222,8 @@ export const EXAMPLE_FILE_PATTERNS = [
   /[/\\]demos?[/\\]/i,
 ];
 
+const EXAMPLE_FILE_RE = new RegExp(EXAMPLE_FILE_PATTERNS.map(p => p.source).join('|'), 'i');
+
 export function isExampleFile(filePath) {
-  return EXAMPLE_FILE_PATTERNS.some((pattern) => pattern.test(filePath));
+  return EXAMPLE_FILE_RE.test(filePath);
 }
@@ -0,0 +1,253 @@
+/**
+ * Ripgrep Prefilter
+ * =================
+ *
+ * When ripgrep (`rg`) is on PATH, the scan command first asks it which files
+ * contain a match for any pattern, and only reads those itself.
+ *
+ * ripgrep searches files in parallel with a DFA over the whole pattern set,
+ * which on a typical tree rules out most files far faster than reading and
+ * decoding them in Node. It only decides which files are read: findings,
+ * columns, entropy checks and confidence still come from pattern-matcher, so
+ * output is the same with or without it.
+ *
+ * That only holds if ripgrep never rules out a file JavaScript would match.
+ * toRipgrepPattern therefore translates each pattern to a Rust regex that
+ * matches at least what the JavaScript one does — \b as the ASCII word
+ * boundary, \d and \w as ASCII classes, \s plus U+FEFF — and returns null
+ * for anything it can't translate that way (non-ASCII text, lookarounds,
+ * backreferences, flags other than g and i). One untranslatable pattern, a
+ * missing rg, or any rg error means every file is read as before.
+ *
+ * The engines also see different text. ripgrep matches UTF-8 bytes, where
+ * invalid sequences match no Unicode class; Node decodes them to U+FFFD,
+ * which `.` and negated classes match, and counts UTF-16 code units where
+ * ripgrep counts codepoints. So `.`, negated classes, \S, \W and \D become
+ * byte classes that exclude only ASCII, repeated one or more times with no
+ * upper bound, since one code unit is one to four bytes.
+ *
+ * USAGE:
+ *   import { findCandidateFiles } from './ripgrep.js';
+ *   const candidates = await findCandidateFiles(files, patterns);
+ *   // → Set of files with a possible match, or null to read them all
+ */
+
+import { spawn } from 'child_process';
+
+// Command-line budget per rg invocation. Windows caps the whole command
+// line at 32K characters; POSIX ARG_MAX is at least 128K in practice.
+const MAX_ARGS_LENGTH = process.platform === 'win32' ? 30_000 : 120_000;
+
+// --encoding=none: by default rg drops a leading UTF-8 BOM and transcodes
+// UTF-16 files, but the scanner matches the bytes as they are.
+const RG_FLAGS = [
+  '--files-with-matches', '--null', '--no-config', '--no-messages', '--no-ignore', '--text', '--encoding=none',
+];
+
+// Escapes Rust accepts for ASCII punctuation. Others (\/, \", \:) are
+// plain characters in JavaScript and are emitted unescaped.
+const RUST_META = new Set('\\.+*?()|[]{}^$#&-~');
+
+/**
+ * Translate a JavaScript RegExp to a Rust regex that matches a superset of it,
+ * or null when that can't be guaranteed.
+ *
+ * @param {RegExp} regex
+ * @returns {string|null}
+ */
+export function toRipgrepPattern(regex) {
+  if (/[^gi]/.test(regex.flags)) return null;
+
+  const src = regex.source;
+  // Only ASCII means the same thing to both engines
+  if (/[^\x00-\x7f]/.test(src)) return null;
+
+  let out = regex.flags.includes('i') ? '(?i)' : '';
+
+  for (let i = 0; i < src.length; i++) {
+    const c = src[i];
+    let atom;
+
+    if (c === '\\') {
+      atom = translateEscape(src[++i], src.slice(i + 1, i + 5), false);
+      if (atom === null) return null;
+      if (src[i] === 'u') i += 4;
+      else if (src[i] === 'x') i += 2;
+    } else if (c === '[') {
+      const end = classEnd(src, i);
+      if (end === -1) return null;
+      atom = translateClass(src.slice(i + 1, end));
+      if (atom === null) return null;
+      i = end;
+    } else if (c === '(' && src[i + 1] === '?') {
+      if (src[i + 2] === ':' || (src[i + 2] === '<' && /[A-Za-z_]/.test(src[i + 3]))) {
+        out += c;
+        continue;
+      }
+      return null;
+    } else if (c === '{') {
+      // A brace that isn't a valid quantifier is a literal in JavaScript
+      const quantifier = /^\{\d+(,\d*)?\}/.exec(src.slice(i));
+      if (quantifier) {
+        out += quantifier[0];
+        i += quantifier[0].length - 1;
+        continue;
+      }
+      atom = { text: '\\{' };
+    } else if (c === '.') {
+      atom = { text: '(?-u:.)', bytes: true };
+    } else {
+      out += c === '}' || c === ']' ? '\\' + c : c;
+      continue;
+    }
+
+    out += atom.text;
+    if (atom.bytes) {
+      // A byte-level atom stands for one UTF-16 code unit in JavaScript,
+      // which is one to four bytes, so it repeats with no upper bound.
+      const quantifier = /^(?:[?*+]|\{(\d+)(?:,\d*)?\})/.exec(src.slice(i + 1));
+      if (!quantifier) {
+        out += '+';
+      } else {
+        out += quantifier[1] !== undefined ? `{${quantifier[1]},}` : quantifier[0] === '+' ? '+' : '*';
+        i += quantifier[0].length;
+      }
+    }
+  }
+
+  return out;
+}
+
+/**
+ * Index of the `]` closing the class opened at `start`, or -1.
+ */
+function classEnd(src, start) {
+  let i = start + 1;
+  if (src[i] === '^') i++;
+  // JavaScript's [] and [^] never match or match anything; neither translates
+  if (src[i] === ']') return -1;
+  for (; i < src.length; i++) {
+    if (src[i] === '\\') i++;
+    else if (src[i] === ']') return i;
+  }
+  return -1;
+}
+
+/**
+ * Translate a character class body: { text, bytes }, or null.
+ *
+ * A positive class, all ASCII by now, matches the same characters in
+ * ripgrep's Unicode mode. A negated one must also match whatever JavaScript
+ * matches in text ripgrep sees as bytes: invalid UTF-8 (U+FFFD once decoded)
+ * and each half of a surrogate pair. So it becomes a class over bytes, which
+ * excludes only ASCII and matches any other byte.
+ */
+function translateClass(body) {
+  const negated = body[0] === '^';
+  let out = '';
+  for (let i = negated ? 1 : 0; i < body.length; i++) {
+    const c = body[i];
+    if (c === '\\') {
+      const escaped = translateEscape(body[++i], body.slice(i + 1, i + 5), true, negated);
+      if (escaped === null) return null;
+      out += escaped.text;
+      if (body[i] === 'u') i += 4;
+      else if (body[i] === 'x') i += 2;
+    } else if (c === '[' || c === '&' || c === '~') {
+      // Nested classes and set operators (&&, --, ~~) only exist in Rust
+      out += '\\' + c;
+    } else if (c === '-' && body[i + 1] === '-') {
+      return null;
+    } else {
+      out += c;
+    }
+  }
+  return negated ? { text: `(?-u:[^${out}])`, bytes: true } : { text: `[${out}]` };
+}
+
+function translateEscape(ch, next4, inClass, negated = false) {
+  if (ch === undefined) return null;
+  const text = (t) => ({ text: t });
+  switch (ch) {
+    case 'b': return text(inClass ? '\\x08' : '(?-u:\\b)');
+    case 'd': return text(inClass ? '0-9' : '[0-9]');
+    case 'w': return text(inClass ? '0-9A-Za-z_' : '[0-9A-Za-z_]');
+    // Inside a byte class \s is ASCII whitespace, so excludes less than JavaScript's
+    case 's': return text(negated ? '\\s' : inClass ? '\\s\\x{FEFF}' : '[\\s\\x{FEFF}]');
+    case 'D': return inClass ? null : { text: '(?-u:\\D)', bytes: true };
+    case 'W': return inClass ? null : { text: '(?-u:\\W)', bytes: true };
+    case 'S': return inClass ? null : { text: '(?-u:\\S)', bytes: true };
+    // ripgrep matches line by line and rejects a literal newline outright
+    case 'n': return inClass ? text('\\n') : null;
+    case 'r': case 't': case 'f': case 'v':
+      return text('\\' + ch);
+    case '0': return /^[0-9]/.test(next4) ? null : text('\\x00');
+    case 'x': return /^[0-7][0-9A-Fa-f]/.test(next4) ? text('\\x' + next4.slice(0, 2)) : null;
+    case 'u': return /^00[0-7][0-9A-Fa-f]$/.test(next4) ? text(`\\x{${next4}}`) : null;
+  }
+  if (/[A-Za-z0-9]/.test(ch)) return null;
+  if (RUST_META.has(ch)) return text('\\' + ch);
+  return text(ch);
+}
+
+/**
+ * Ask ripgrep which files could match any of the patterns.
+ *
+ * @param {string[]} files — Absolute file paths
+ * @param {object[]} patterns — Pattern list (see compilePatterns)
+ * @returns {Promise<Set<string>|null>} — null when ripgrep can't be used
+ */
+export async function findCandidateFiles(files, patterns) {
+  const regexArgs = [];
+  for (const { pattern } of patterns) {
+    const translated = toRipgrepPattern(pattern);
+    if (translated === null) return null;
+    regexArgs.push('-e', translated);
+  }
+
+  const baseLength = [...RG_FLAGS, ...regexArgs].reduce((n, arg) => n + arg.length + 1, 0);
+  const candidates = new Set();
+  let start = 0;
+
+  while (start < files.length) {
+    let end = start;
+    let length = baseLength;
+    while (end < files.length && (end === start || length + files[end].length + 1 <= MAX_ARGS_LENGTH)) {
+      length += files[end].length + 1;
+      end++;
+    }
+
+    const matched = await runRipgrep([...RG_FLAGS, ...regexArgs, '--', ...files.slice(start, end)]);
+    if (matched === null) return null;
+    for (const file of matched) candidates.add(file);
+    start = end;
+  }
+
+  return candidates;
+}
+
+function runRipgrep(args) {
+  return new Promise((resolve) => {
+    let child;
+    try {
+      child = spawn('rg', args, { stdio: ['ignore', 'pipe', 'ignore'] });
+    } catch {
+      resolve(null);
+      return;
+    }
+
+    const chunks = [];
+    child.stdout.on('data', (chunk) => chunks.push(chunk));
+    // Not installed (ENOENT) or not runnable
+    child.on('error', () => resolve(null));
+    child.on('close', (code) => {
+      // 0: matches, 1: no matches, anything else: bad regex, unreadable file, ...
+      if (code !== 0 && code !== 1) {
+        resolve(null);
+        return;
+      }
+      const output = Buffer.concat(chunks).toString('utf-8');
+      resolve(output.split('\0').filter(Boolean));
+    });
+  });
+}
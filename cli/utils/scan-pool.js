@@ -0,0 +1,290 @@
+/**
+ * Scan Pool
+ * =========
+ *
+ * Spreads the scan command's per-file matching across worker threads.
+ *
+ * Files are independent of each other, so a large tree scans in parallel
+ * with no coordination beyond handing out work. Each worker compiles its own
+ * matcher once and then takes files in batches of BATCH_SIZE, asking for the
+ * next batch when it finishes, so a worker that lands on a few large files
+ * does not hold up the rest.
+ *
+ * Starting a worker costs a few tens of milliseconds, which is more than
+ * scanning a small project takes. Below MIN_FILES_PER_WORKER files per
+ * worker the scan stays on the main thread.
+ *
+ * When ripgrep is installed, it first rules out files with no possible
+ * match (see ripgrep.js), and only the rest are read here.
+ *
+ * USAGE:
+ *   import { scanFiles } from './scan-pool.js';
+ *   const { results } = await scanFiles(files, patterns);
+ *   // → results: [{ file, findings }] for files with findings, in input order
+ */
+
+import fs from 'fs';
+import os from 'os';
+import buffer from 'buffer';
+import { Worker, isMainThread, parentPort, workerData } from 'worker_threads';
+import { compilePatterns, matchContent, toFindings } from './pattern-matcher.js';
+import { findCandidateFiles } from './ripgrep.js';
+import { MAX_FILE_SIZE } from './patterns.js';
+
+const BATCH_SIZE = 32;
+const MIN_FILES_PER_WORKER = 250;
+const SNIFF_BYTES = 4096;
+// Below this, spawning rg costs more than reading the files
+const MIN_FILES_FOR_RIPGREP = 100;
+const CONFIDENCE_LEVELS = ['high', 'medium', 'low'];
+
+/**
+ * Scan one file. Returns [] for files that can't be read or look binary.
+ */
+export function scanFile(filePath, matcher) {
+  return toFindings(matchFile(filePath, matcher), matcher.patterns);
+}
+
+/**
+ * Scan one file and return compact matches (see matchContent).
+ */
+function matchFile(filePath, matcher) {
+  try {
+    const bytes = readBytes(filePath);
+    if (bytes.length === 0 || isBinary(bytes)) return [];
+    return matchContent(decode(bytes), matcher);
+  } catch {
+    // Skip files that can't be read (binary, permissions, etc.)
+    return [];
+  }
+}
+
+// Per-thread read buffer, one byte over MAX_FILE_SIZE so a full read shows
+// the file is larger than the scan command would have picked.
+let scratch = null;
+
+/**
+ * Read a file into the thread's reusable buffer and return a view of it.
+ *
+ * readFileSync stats the file and allocates a new buffer sized to it, for
+ * every file. Reading into one buffer skips both. The view is only valid
+ * until the next call. Larger files, which only reach here when scanFile is
+ * called directly, get a buffer of their own.
+ */
+function readBytes(filePath) {
+  scratch ??= Buffer.allocUnsafeSlow(MAX_FILE_SIZE + 1);
+  const fd = fs.openSync(filePath, 'r');
+  try {
+    let length = 0;
+    let read;
+    while (length < scratch.length && (read = fs.readSync(fd, scratch, length, scratch.length - length, null)) > 0) {
+      length += read;
+    }
+    if (length < scratch.length) return scratch.subarray(0, length);
+  } finally {
+    fs.closeSync(fd);
+  }
+  return fs.readFileSync(filePath);
+}
+
+/**
+ * Sniff the start of a file for binary content, the way git and file(1) do:
+ * a NUL byte, or more than 30% control characters other than whitespace.
+ * Catches extensionless binaries that SKIP_EXTENSIONS lets through.
+ */
+function isBinary(bytes) {
+  const end = Math.min(bytes.length, SNIFF_BYTES);
+  let control = 0;
+  for (let i = 0; i < end; i++) {
+    const b = bytes[i];
+    if (b === 0) return true;
+    if (b < 9 || (b > 13 && b < 32)) control++;
+  }
+  return control / end > 0.3;
+}
+
+/**
+ * Decode file bytes to a string for matching.
+ *
+ * Most source files are pure ASCII, where latin1 and UTF-8 decode to the
+ * same string and latin1 skips UTF-8 validation. Anything else goes through
+ * the UTF-8 decoder as before, so findings don't change. buffer.isAscii
+ * arrived in Node 18.15; older versions always take the UTF-8 path.
+ */
+function decode(bytes) {
+  if (buffer.isAscii?.(bytes)) return bytes.toString('latin1');
+  return bytes.toString('utf-8');
+}
+
+/**
+ * Scan files against patterns, in worker threads when there are enough of them.
+ *
+ * @param {string[]} files — Absolute file paths
+ * @param {object[]} patterns — Pattern list (see compilePatterns)
+ * @param {object} [options]
+ * @param {function} [options.onProgress] — Called with (scannedCount, file)
+ * @param {number} [options.workers] — Worker count (default: by core and file count)
+ * @param {string} [options.engine] — 'auto' (ripgrep prefilter when installed) or 'node'
+ * @param {boolean} [options.failFast] — Stop at the first file with findings
+ * @returns {Promise<{ results: { file: string, findings: object[] }[], scannedCount: number, stopped: boolean }>}
+ *   — results for files with findings; how many files were scanned; whether
+ *   failFast stopped the scan before every file was scanned
+ */
+export async function scanFiles(files, patterns, options = {}) {
+  const candidates = options.engine !== 'node' && files.length >= MIN_FILES_FOR_RIPGREP
+    ? await findCandidateFiles(files, patterns)
+    : null;
+  const toRead = candidates ? files.filter(file => candidates.has(file)) : files;
+
+  // Files ripgrep ruled out count as scanned
+  const skipped = files.length - toRead.length;
+  const onProgress = options.onProgress && skipped > 0
+    ? (scannedCount, file) => options.onProgress(skipped + scannedCount, file)
+    : options.onProgress;
+
+  const parallelism = os.availableParallelism?.() ?? os.cpus().length;
+  const workerCount = options.workers
+    ?? Math.min(parallelism, Math.floor(toRead.length / MIN_FILES_PER_WORKER));
+
+  const { failFast } = options;
+  const { findingsByFile, scanned } = workerCount < 2 || toRead.length === 0
+    ? scanSequential(toRead, patterns, onProgress, failFast)
+    : await scanParallel(toRead, patterns, workerCount, onProgress, failFast);
+
+  const results = [];
+  for (let i = 0; i < toRead.length; i++) {
+    if (findingsByFile[i]?.length > 0) {
+      results.push({ file: toRead[i], findings: findingsByFile[i] });
+    }
+  }
+  return { results, scannedCount: skipped + scanned, stopped: scanned < toRead.length };
+}
+
+function scanSequential(files, patterns, onProgress, failFast) {
+  const matcher = compilePatterns(patterns);
+  const findingsByFile = [];
+  for (let i = 0; i < files.length; i++) {
+    findingsByFile.push(scanFile(files[i], matcher));
+    onProgress?.(i + 1, files[i]);
+    if (failFast && findingsByFile[i].length > 0) break;
+  }
+  return { findingsByFile, scanned: findingsByFile.length };
+}
+
+function scanParallel(files, patterns, workerCount, onProgress, failFast) {
+  return new Promise((resolve, reject) => {
+    const findingsByFile = new Array(files.length);
+    const workers = [];
+    let next = 0;
+    let scanned = 0;
+    let settled = false;
+
+    const finish = (err) => {
+      if (settled) return;
+      settled = true;
+      for (const worker of workers) worker.terminate();
+      if (err) reject(err);
+      else resolve({ findingsByFile, scanned });
+    };
+
+    const dispatch = (worker) => {
+      if (next >= files.length) return;
+      const start = next;
+      next = Math.min(next + BATCH_SIZE, files.length);
+      worker.postMessage({ start, files: files.slice(start, next) });
+    };
+
+    for (let i = 0; i < workerCount; i++) {
+      // Patterns are plain objects holding RegExps, which structured clone
+      // copies as-is, so custom patterns from .ship-safe.json travel too.
+      const worker = new Worker(new URL(import.meta.url), {
+        workerData: { shipSafeScanPool: true, patterns },
+      });
+      worker.on('message', ({ start, packed }) => {
+        const batch = unpackFindings(packed, patterns);
+        let found = false;
+        for (let j = 0; j < batch.length; j++) {
+          findingsByFile[start + j] = batch[j];
+          found ||= batch[j].length > 0;
+          scanned++;
+          onProgress?.(scanned, files[start + j]);
+        }
+        // Batches still out with other workers are dropped with them
+        if (scanned === files.length || (failFast && found)) finish();
+        else dispatch(worker);
+      });
+      worker.on('error', finish);
+      worker.on('exit', (code) => {
+        if (code !== 0) finish(new Error(`Scan worker exited with code ${code}`));
+      });
+      workers.push(worker);
+      dispatch(worker);
+    }
+  });
+}
+
+/**
+ * Pack a batch's matches into one column per field for the trip back to the
+ * main thread. Typed arrays are transferred rather than copied, and structured
+ * clone handles a few columns several times faster than an array per match.
+ */
+function packMatches(matchesByFile) {
+  const total = matchesByFile.reduce((n, matches) => n + matches.length, 0);
+  const packed = {
+    counts: new Int32Array(matchesByFile.length),
+    lines: new Int32Array(total),
+    columns: new Int32Array(total),
+    patterns: new Int32Array(total),
+    confidences: new Uint8Array(total),
+    matched: new Array(total),
+  };
+
+  let k = 0;
+  matchesByFile.forEach((matches, i) => {
+    packed.counts[i] = matches.length;
+    for (const [line, column, matched, index, confidence] of matches) {
+      packed.lines[k] = line;
+      packed.columns[k] = column;
+      packed.patterns[k] = index;
+      packed.confidences[k] = CONFIDENCE_LEVELS.indexOf(confidence);
+      packed.matched[k] = matched;
+      k++;
+    }
+  });
+  return packed;
+}
+
+/**
+ * Expand a packed batch into findings, one array per file.
+ */
+function unpackFindings(packed, patterns) {
+  const findingsByFile = [];
+  let k = 0;
+  for (const count of packed.counts) {
+    const matches = [];
+    for (const end = k + count; k < end; k++) {
+      matches.push([
+        packed.lines[k],
+        packed.columns[k],
+        packed.matched[k],
+        packed.patterns[k],
+        CONFIDENCE_LEVELS[packed.confidences[k]],
+      ]);
+    }
+    findingsByFile.push(toFindings(matches, patterns));
+  }
+  return findingsByFile;
+}
+
+// =============================================================================
+// WORKER
+// =============================================================================
+
+if (!isMainThread && workerData?.shipSafeScanPool) {
+  const matcher = compilePatterns(workerData.patterns);
+  parentPort.on('message', ({ start, files }) => {
+    const packed = packMatches(files.map(file => matchFile(file, matcher)));
+    const { counts, lines, columns, patterns, confidences } = packed;
+    parentPort.postMessage({ start, packed }, [counts, lines, columns, patterns, confidences].map(a => a.buffer));
+  });
+}